@@ -1,5 +1,10 @@
+import time
+
+import ciso8601
+import orjson
 import requests
-from datetime import datetime, timedelta
+from requests.adapters import HTTPAdapter
+from datetime import timezone
 
 BASE_URL = "http://localhost:3000"
 HEADERS = {
@@ -7,55 +12,72 @@ HEADERS = {
 }
 TIMEOUT = 30
 
+# Single keep-alive session so every request reuses the same pooled connection
+SESSION = requests.Session()
+SESSION.headers.update(HEADERS)
+SESSION.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
+
+# Module-scope helpers: defined once instead of being re-created on every test
+# invocation, so repeated runs in one process (pytest parameterization/xdist)
+# reuse the same code objects.
+def fetch_news():
+    # GET /api/feeder/ assumed to return news articles
+    resp = SESSION.get(
+        f"{BASE_URL}/api/feeder/",
+        timeout=TIMEOUT,
+    )
+    assert resp.status_code == 200, f"feeder API failed with {resp.status_code}: {resp.text}"
+    # orjson parses the raw bytes directly, skipping requests' text decode
+    data = orjson.loads(resp.content)
+    news_articles = data.get("news_items") or data.get("news_articles")
+    assert news_articles is not None, "No news_articles key returned in feeder response"
+    return news_articles
+
+
+def parse_published_at(published_at_str):
+    # Article must have published_at in ISO8601 format or epoch timestamp expected.
+    # Returns epoch seconds: the freshness check is a plain float comparison, so
+    # there is no need to build datetime/timedelta objects per article (and no
+    # deprecated utcnow()/utcfromtimestamp() calls).
+    assert published_at_str, "Article missing published_at field"
+    try:
+        # ciso8601 parses ISO 8601 in C, ~5-10x faster than the
+        # fromisoformat + string-munging path it replaces
+        published_dt = ciso8601.parse_datetime(published_at_str)
+        if published_dt.tzinfo is None:
+            published_dt = published_dt.replace(tzinfo=timezone.utc)
+        return published_dt.timestamp()
+    except ValueError:
+        # If parsing fails, try epoch int
+        try:
+            return float(int(published_at_str))
+        except Exception:
+            assert False, f"Invalid published_at format: {published_at_str}"
+
+
 def test_fetch_news_with_freshness_filtering():
     """
     Test fetching news articles via /api/feeder API with freshness filtering (1h to 24h).
     Validate that only news articles fresh within the specified hours are returned.
     """
 
-    # Define a helper to fetch news articles from feeder API
-    def fetch_news():
-        # GET /api/feeder/ assumed to return news articles
-        resp = requests.get(
-            f"{BASE_URL}/api/feeder/",
-            headers=HEADERS,
-            timeout=TIMEOUT,
-        )
-        assert resp.status_code == 200, f"feeder API failed with {resp.status_code}: {resp.text}"
-        data = resp.json()
-        news_articles = data.get("news_items") or data.get("news_articles")
-        assert news_articles is not None, "No news_articles key returned in feeder response"
-        return news_articles
+    # Fetch and parse once; the three freshness checks below only differ in the
+    # allowed age, so there is no need to re-request or re-parse per hour setting.
+    news = fetch_news()
+    assert isinstance(news, list), "news_articles should be a list"
+    parsed = [(article, parse_published_at(article.get("published_at"))) for article in news]
+    now_epoch = time.time()
 
     # Test across different freshness hour settings 1 to 24 hours (sample only 3 values for brevity)
-    for freshness_hour in [1, 6, 24]:
-        news = fetch_news()
-        now = datetime.utcnow()
-
-        assert isinstance(news, list), "news_articles should be a list"
+    for freshness_hour in (1, 6, 24):
+        allowed = freshness_hour * 3600
 
         # Validate that each news article's published time is within freshness_hours
-        for article in news:
-            # Article must have published_at in ISO8601 format or epoch timestamp expected
-            published_at_str = article.get("published_at")
-            assert published_at_str, "Article missing published_at field"
-            try:
-                # Try parsing ISO 8601 date string
-                published_dt = datetime.fromisoformat(published_at_str.replace("Z", "+00:00")).replace(tzinfo=None)
-            except Exception:
-                # If parsing fails, try epoch int
-                try:
-                    epoch = int(published_at_str)
-                    published_dt = datetime.utcfromtimestamp(epoch)
-                except Exception:
-                    assert False, f"Invalid published_at format: {published_at_str}"
-
-            age = now - published_dt
-            allowed_delta = timedelta(hours=freshness_hour)
+        for article, published_epoch in parsed:
             # Articles might be older than freshness_hour, so filter out those older
             # and only check that returned articles are not older than freshness_hour
-            assert age <= allowed_delta, (
-                f"Article published_at {published_at_str} is older than freshness filter {freshness_hour}h"
+            assert now_epoch - published_epoch <= allowed, (
+                f"Article published_at {article.get('published_at')} is older than freshness filter {freshness_hour}h"
             )
 
     print("test_fetch_news_with_freshness_filtering passed")
@@ -1,124 +1,86 @@
 import asyncio
+import hashlib
+import os
+
+import orjson
+import pytest
+import requests
 from playwright import async_api
 from playwright.async_api import expect
 
+# The deduplication logic itself is fully covered by the API-level test, so a
+# fast run can drop this browser pass without losing assertion coverage.
+if os.environ.get("FAST_TESTS") == "1":
+    pytest.skip(
+        "Covered by TC002_deduplicate_news_articles_by_hash.py (API)",
+        allow_module_level=True,
+    )
+
+BASE_URL = "http://localhost:3000"
+TIMEOUT = 30
+
+# Single keep-alive session for the API-side deduplication check
+SESSION = requests.Session()
+SESSION.headers.update({"Content-Type": "application/json"})
+
+# Used only by the standalone entry point; under pytest the shared fixtures in
+# conftest.py provide the browser and context.
+BROWSER_ARGS = [
+    "--window-size=1280,720",                      # Set the browser window size
+    "--disable-dev-shm-usage",                     # Avoid using /dev/shm which can cause issues in containers
+    "--disable-background-timer-throttling",       # Keep timers running at full rate while headless
+    "--disable-renderer-backgrounding",            # Don't deprioritize the renderer when unfocused
+    "--disable-backgrounding-occluded-windows",    # Treat occluded windows as foreground
+    "--disable-features=TranslateUI,site-per-process",
+    "--no-sandbox",
+    "--disable-gpu",                               # Headless CI has no GPU to accelerate with
+]
+
+
+def _article_hash(article):
+    normalized_title = " ".join(article["title"].lower().split())
+    normalized_source = (article.get("source_name") or article.get("source") or "").lower()
+    return hashlib.sha256((normalized_title + "|" + normalized_source).encode()).hexdigest()
+
+
+async def test_news_article_deduplication_by_sha_256_hash(context):
+    # Verify deduplication directly against the API: fetching the rendered pages
+    # just to count duplicates pays 3-5x the latency of a single JSON request.
+    resp = SESSION.get(f"{BASE_URL}/api/feeder/news", timeout=TIMEOUT)
+    assert resp.status_code == 200, f"Failed to fetch news articles: {resp.text}"
+    articles = orjson.loads(resp.content)
+    assert isinstance(articles, list), "News articles response is not a list."
+
+    hashes = {_article_hash(a) for a in articles}
+    assert len(hashes) == len(articles), (
+        f"Duplicate articles detected: {len(articles) - len(hashes)} repeated "
+        f"(title, source) hashes among {len(articles)} articles"
+    )
+
+    # One navigation to the Posts page to confirm the UI reports zero duplicates,
+    # instead of bouncing through /mock-rss-feed, /agent and /api-docs.
+    page = await context.new_page()
+    await page.goto(f"{BASE_URL}/posts", wait_until="domcontentloaded", timeout=10000)
+
+    # --> Assertions to verify final state
+    await expect(page.locator('text=duplicates').first).to_be_visible(timeout=30000)
+    await expect(page.locator('text=0').first).to_be_visible(timeout=30000)
+
+
 async def run_test():
+    # Standalone entry point: launches its own browser. Under pytest the
+    # session-scoped fixtures in conftest.py supply the browser and context.
     pw = None
     browser = None
     context = None
-    
+
     try:
-        # Start a Playwright session in asynchronous mode
         pw = await async_api.async_playwright().start()
-        
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
-        
-        # Create a new browser context (like an incognito window)
+        browser = await pw.chromium.launch(headless=True, args=BROWSER_ARGS)
         context = await browser.new_context()
         context.set_default_timeout(5000)
-        
-        # Open a new page in the browser context
-        page = await context.new_page()
-        
-        # Navigate to your target URL and wait until the network request is committed
-        await page.goto("http://localhost:3000/agent", wait_until="commit", timeout=10000)
-        
-        # Wait for the main page to reach DOMContentLoaded state (optional for stability)
-        try:
-            await page.wait_for_load_state("domcontentloaded", timeout=3000)
-        except async_api.Error:
-            pass
-        
-        # Iterate through all iframes and wait for them to load as well
-        for frame in page.frames:
-            try:
-                await frame.wait_for_load_state("domcontentloaded", timeout=3000)
-            except async_api.Error:
-                pass
-        
-        # Interact with the page elements to simulate user flow
-        # -> Inject two news articles with identical normalized title and source but different IDs into the RSS feed mock.
-        await page.goto('http://localhost:3000/mock-rss-feed', timeout=10000)
-        await asyncio.sleep(3)
-        
-
-        # -> Return to AI News Agent page to explore other options for injecting duplicate news articles.
-        await page.goto('http://localhost:3000/agent', timeout=10000)
-        await asyncio.sleep(3)
-        
-
-        # -> Check if there is any option or button to inject or mock news articles or access the database for duplicate detection testing.
-        frame = context.pages[-1]
-        # Click Preview Queue to check if it shows articles and allows injection or inspection.
-        elem = frame.locator('xpath=html/body/div[2]/main/div/div/div[2]/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Trigger news refresh by clicking 'Start Agent' button to see if duplicate detection occurs during processing.
-        frame = context.pages[-1]
-        # Click Start Agent button to trigger news refresh and processing
-        elem = frame.locator('xpath=html/body/div[2]/main/div/div/div/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Click Start Agent button to trigger news refresh and processing to check for duplicate detection.
-        frame = context.pages[-1]
-        # Click Start Agent button to trigger news refresh and processing
-        elem = frame.locator('xpath=html/body/div[2]/main/div/div/div/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Check the Posts page or database to verify if duplicate articles based on SHA-256 hash of normalized title and source are excluded, ensuring only one instance exists.
-        frame = context.pages[-1]
-        # Navigate to Posts page to check for duplicate articles in the database or posts list
-        elem = frame.locator('xpath=html/body/div[2]/nav/div/div/div[2]/a[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Inject two news articles with identical normalized title and source but different IDs into the RSS feed mock.
-        await page.goto('http://localhost:3000/mock-rss-feed', timeout=10000)
-        await asyncio.sleep(3)
-        
-
-        # -> Check if there is any API endpoint or backend interface accessible from the current UI or documentation to inject test articles with duplicate normalized titles and sources.
-        await page.goto('http://localhost:3000/api-docs', timeout=10000)
-        await asyncio.sleep(3)
-        
-
-        # -> Return to AI News Agent page to check for any other options or settings related to duplicate detection or article injection.
-        await page.goto('http://localhost:3000/agent', timeout=10000)
-        await asyncio.sleep(3)
-        
-
-        # -> Click 'Preview Queue' to inspect the current articles in the queue for duplicates or clues about duplicate detection.
-        frame = context.pages[-1]
-        # Click Preview Queue button to inspect articles in the queue
-        elem = frame.locator('xpath=html/body/div[2]/main/div/div/div[2]/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Navigate to Posts page to check for duplicate articles based on SHA-256 hash of normalized title and source.
-        frame = context.pages[-1]
-        # Click Posts page link to verify duplicate articles presence
-        elem = frame.locator('xpath=html/body/div[2]/nav/div/div/div[2]/a[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # --> Assertions to verify final state
-        frame = context.pages[-1]
-        await expect(frame.locator('text=duplicates').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=0').first).to_be_visible(timeout=30000)
-        await asyncio.sleep(5)
-    
+        await test_news_article_deduplication_by_sha_256_hash(context)
+
     finally:
         if context:
             await context.close()
@@ -126,6 +88,6 @@ async def run_test():
             await browser.close()
         if pw:
             await pw.stop()
-            
-asyncio.run(run_test())
-    
\ No newline at end of file
+
+if __name__ == "__main__":
+    asyncio.run(run_test())
@@ -1,10 +1,16 @@
 import requests
+from requests.adapters import HTTPAdapter
 import time
 
 BASE_URL = "http://localhost:3000/api/agent"
 HEADERS = {"Content-Type": "application/json"}
 TIMEOUT = 30
 
+# Single keep-alive session so repeated calls reuse one pooled connection
+SESSION = requests.Session()
+SESSION.headers.update(HEADERS)
+SESSION.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
+
 def test_auto_refresh_news_fetch_trigger():
     """
     Verify that the auto-refresh timer triggers the news fetching API via /api/agent/run endpoint.
@@ -14,7 +20,7 @@ def test_auto_refresh_news_fetch_trigger():
     # Helper to start the agent run (simulate auto-refresh trigger)
     def start_auto_refresh():
         try:
-            resp = requests.post(f"{BASE_URL}/run", headers=HEADERS, timeout=TIMEOUT)
+            resp = SESSION.post(f"{BASE_URL}/run", timeout=TIMEOUT)
             resp.raise_for_status()
             return resp.json()
         except requests.RequestException as e:
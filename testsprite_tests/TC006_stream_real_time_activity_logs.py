@@ -1,7 +1,27 @@
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
 import time
 import threading
 
+# orjson parses response bytes in C, roughly 2-3x faster than stdlib json on
+# these payloads; fall back to requests' parser when it isn't installed.
+try:
+    import orjson
+
+    def _json(r):
+        return orjson.loads(r.content)
+
+    _loads = orjson.loads
+except ImportError:
+    import json
+
+    def _json(r):
+        return r.json()
+
+    _loads = json.loads
+
+
 BASE_URL = "http://localhost:3000/api/agent"
 TIMEOUT = 30
 HEADERS = {
@@ -9,25 +29,101 @@ HEADERS = {
     "Content-Type": "application/json"
 }
 
+# One keep-alive session shared by the streaming thread and the main thread;
+# retries are disabled so backoff timings are not distorted by silent replays.
+SESSION = requests.Session()
+SESSION.headers.update(HEADERS)
+SESSION.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=4, max_retries=Retry(total=0)))
+
+# Backoff schedule while the log count is flat: each successive idle poll
+# waits longer, capped at 2s. While logs are actively growing we poll at 100ms.
+_IDLE_BACKOFF = (0.25, 0.5, 1.0, 2.0)
+
+
+def cached_get(url, params, state, headers=HEADERS):
+    """Conditional GET against a status endpoint.
+
+    Remembers the last ETag in ``state`` and sends If-None-Match on the next
+    call; a 304 reuses the cached parsed body, skipping the body transfer and
+    the JSON parse for the common "nothing changed" poll. Servers that never
+    emit ETags degrade transparently to plain GETs.
+    """
+    req_headers = dict(headers)
+    if state.get("etag"):
+        req_headers["If-None-Match"] = state["etag"]
+    response = SESSION.get(url, headers=req_headers, params=params, timeout=TIMEOUT)
+    if response.status_code == 304 and state.get("body") is not None:
+        return response, state["body"]
+    assert response.status_code == 200, f"Status endpoint returned {response.status_code}"
+    state["etag"] = response.headers.get("ETag")
+    state["body"] = _json(response)
+    return response, state["body"]
+
 def test_stream_real_time_activity_logs():
     run_id = None
-    stop_stream = False
+    # Cleared once the run is observed in a terminal state, so cleanup can
+    # skip the cancel round trip entirely.
+    needs_cancel = True
+    stop_stream = threading.Event()
+    # Set by the streaming thread once it has seen logs AND a terminal state,
+    # so the collection window ends as soon as the run does instead of always
+    # burning the full 10 seconds.
+    done = threading.Event()
+    # Holds the live SSE response (if any) so the main thread can unblock the
+    # reader immediately by closing it.
+    stream_resp = {"resp": None}
 
     def stream_logs():
-        nonlocal stop_stream, run_id
+        nonlocal run_id
         url = f"{BASE_URL}/status"
         params = {}
         headers = HEADERS.copy()
         try:
+            # Prefer a single long-lived event stream when the server offers
+            # one: each log arrives as a push over one socket with no per-poll
+            # request cost and no sleeps at all.
+            sse_headers = dict(headers)
+            sse_headers["Accept"] = "text/event-stream"
+            sse_params = {"runId": run_id} if run_id is not None else {}
+            sse_resp = SESSION.get(url, headers=sse_headers, params=sse_params, stream=True, timeout=TIMEOUT)
+            if sse_resp.headers.get("Content-Type", "").startswith("text/event-stream"):
+                stream_resp["resp"] = sse_resp
+                seen_logs = 0
+                try:
+                    for line in sse_resp.iter_lines(decode_unicode=True):
+                        if stop_stream.is_set():
+                            return
+                        if not line or not line.startswith("data:"):
+                            continue
+                        event = _loads(line[len("data:"):].strip())
+                        assert isinstance(event, dict), "SSE event is not a JSON object"
+                        if "timestamp" in event:
+                            assert "message" in event or "state" in event, "Log event missing expected keys"
+                            seen_logs += 1
+                        state = event.get("state") or event.get("status")
+                        if seen_logs and isinstance(state, str) and state.lower() in {"completed", "failed", "cancelled"}:
+                            done.set()
+                            return
+                except (requests.RequestException, ValueError):
+                    # Stream torn down underneath us (stop path) or a partial
+                    # trailing event; either way the stream is finished.
+                    pass
+                finally:
+                    sse_resp.close()
+                return
+            # Server answered with a plain JSON body: fall back to polling.
+            sse_resp.close()
             # Stream the activity logs as a long-poll or repeatedly fetch status
             # Assuming the API supports Server-Sent Events or similar for streaming
-            # If not, fallback to polling every 1 second for updates
-            while not stop_stream:
+            # If not, fallback to polling with load-adaptive backoff: fast while
+            # new entries are arriving, backing off when responses are identical.
+            last_len = 0
+            idle_iters = 0
+            etag_state = {"etag": None, "body": None}
+            while not stop_stream.is_set():
                 if run_id is not None:
                     params = {"runId": run_id}
-                response = requests.get(url, headers=headers, params=params, timeout=TIMEOUT)
-                assert response.status_code == 200, f"Status endpoint returned {response.status_code}"
-                data = response.json()
+                response, data = cached_get(url, params, etag_state, headers=headers)
                 assert isinstance(data, dict), "Status response is not a JSON object"
                 # Expect keys related to live activity logs and processing states
                 assert "runId" in data or run_id is not None, "Missing runId in activity logs"
@@ -36,21 +132,36 @@ def test_stream_real_time_activity_logs():
                 # Basic checks on content type and structure
                 logs = data.get("activityLogs") or data.get("logs") or data.get("activities")
                 assert isinstance(logs, list), "Logs should be a list"
-                # Attempt to confirm some entries have timestamps and tool call info
-                if logs:
-                    for log in logs:
-                        assert "timestamp" in log, "Log entry missing timestamp"
-                        assert "message" in log or "state" in log, "Log entry missing expected keys"
-                time.sleep(1)
+                # Attempt to confirm entries have timestamps and tool call info.
+                # Only the suffix that arrived since the previous poll is
+                # validated - earlier entries were already checked, so the cost
+                # per poll is O(new logs) instead of O(all logs).
+                new_logs = logs[last_len:]
+                assert all("timestamp" in log for log in new_logs), "Log entry missing timestamp"
+                assert all("message" in log or "state" in log for log in new_logs), "Log entry missing expected keys"
+                state = data.get("state") or data.get("status")
+                if logs and isinstance(state, str) and state.lower() in {"completed", "failed", "cancelled"}:
+                    done.set()
+                    return
+                if len(logs) > last_len:
+                    last_len = len(logs)
+                    idle_iters = 0
+                    delay = 0.1
+                else:
+                    delay = _IDLE_BACKOFF[min(idle_iters, 3)]
+                    idle_iters += 1
+                # Event.wait instead of time.sleep: the main thread's stop signal
+                # wakes the loop immediately rather than after a full backoff step.
+                stop_stream.wait(delay)
         except requests.RequestException as e:
             assert False, f"Request exception during streaming status logs: {e}"
 
     try:
         # Start agent run to generate real-time logs
         run_url = BASE_URL
-        run_response = requests.post(run_url, headers=HEADERS, timeout=TIMEOUT)
+        run_response = SESSION.post(run_url, headers=HEADERS, timeout=TIMEOUT)
         assert run_response.status_code in {200, 201}, f"Agent run start failed with {run_response.status_code}"
-        run_json = run_response.json()
+        run_json = _json(run_response)
         run_id = run_json.get("runId") or run_json.get("id")
         assert run_id is not None, "Run ID not returned on agent run start"
 
@@ -58,37 +169,46 @@ def test_stream_real_time_activity_logs():
         stream_thread = threading.Thread(target=stream_logs)
         stream_thread.start()
 
-        # Let the streaming run for a period to collect logs
-        time.sleep(10)
+        # Collect logs until the run reaches a terminal state, bounded at 10s
+        done.wait(timeout=10)
 
-        # After streaming period, stop the stream
-        stop_stream = True
+        # After streaming period, stop the stream. Closing the SSE response
+        # (when one is open) unblocks the reader mid-recv instead of waiting
+        # for the next event.
+        stop_stream.set()
+        if stream_resp["resp"] is not None:
+            stream_resp["resp"].close()
         stream_thread.join()
 
         # Final check on run status to ensure run completed or is in expected state
         status_url = f"{BASE_URL}/status"
         status_params = {"runId": run_id}
-        status_response = requests.get(status_url, headers=HEADERS, params=status_params, timeout=TIMEOUT)
+        status_response = SESSION.get(status_url, headers=HEADERS, params=status_params, timeout=TIMEOUT)
         assert status_response.status_code == 200, f"Status check failed with {status_response.status_code}"
-        status_data = status_response.json()
+        status_data = _json(status_response)
         assert "state" in status_data or "status" in status_data, "Run status missing in final status call"
         state_val = status_data.get("state") or status_data.get("status")
         assert isinstance(state_val, str), "Run status value should be a string"
         # Optionally check if state is one of expected states e.g. running, completed, failed
         assert state_val.lower() in {"running", "completed", "failed", "cancelled"} , f"Unexpected run state: {state_val}"
+        if state_val.lower() in {"completed", "failed", "cancelled"}:
+            needs_cancel = False
 
     finally:
-        # Attempt to cancel or cleanup run if API supports cancellation
-        if run_id:
+        # Attempt to cancel or cleanup run if API supports cancellation; skipped
+        # when the run already finished, and bounded at 2s since cleanup is
+        # best-effort.
+        if run_id and needs_cancel:
             cancel_url = BASE_URL
             try:
                 # Attempt DELETE with JSON payload
-                cancel_response = requests.delete(cancel_url, headers=HEADERS, json={"runId": run_id}, timeout=TIMEOUT)
+                cancel_response = SESSION.delete(cancel_url, headers=HEADERS, json={"runId": run_id}, timeout=2)
                 if cancel_response.status_code not in {200, 204}:
                     # Try POST to cancel endpoint if exists
-                    cancel_response = requests.post(f"{BASE_URL}/cancel", headers=HEADERS, json={"runId": run_id}, timeout=TIMEOUT)
+                    cancel_response = SESSION.post(f"{BASE_URL}/cancel", headers=HEADERS, json={"runId": run_id}, timeout=2)
                 # No assertion on cancel as not all APIs support it
             except Exception:
                 pass
+        SESSION.close()
 
 test_stream_real_time_activity_logs()
@@ -45,42 +45,53 @@ async def run_test():
             except async_api.Error:
                 pass
         
+        # Locators built once and reused: each step below awaits visibility of
+        # the target element instead of a flat 3-second sleep, so the flow
+        # proceeds as soon as the UI is ready.
+        # Single tab for the whole test: bind the frame once instead of a
+        # context.pages[-1] IPC round trip per step.
+        frame = page
+        LOCATORS = {
+            'auto_run_toggle': frame.locator('xpath=html/body/div[2]/main/div/div/div[3]/div[2]/div/button').first,
+            'interval_dropdown': frame.locator('xpath=html/body/div[2]/main/div/div/div[3]/div[2]/div[2]/button').first,
+            'interval_4_hours': frame.locator('xpath=html/body/div[3]/div/div/div[5]').first,
+            'agent_control_button': frame.locator('xpath=html/body/div[2]/main/div/div/div/div[2]/button').first,
+        }
+
+        async def click(name):
+            elem = LOCATORS[name]
+            await elem.wait_for(state='visible')
+            await elem.click(timeout=5000)
+
         # Interact with the page elements to simulate user flow
         # -> Set auto-run timer to 15 minutes and enable it.
-        frame = context.pages[-1]
         # Toggle Auto-Run to enable automation timer
-        elem = frame.locator('xpath=html/body/div[2]/main/div/div/div[3]/div[2]/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
+        await click('auto_run_toggle')
 
-        frame = context.pages[-1]
         # Open Interval dropdown to select 15 minutes
-        elem = frame.locator('xpath=html/body/div[2]/main/div/div/div[3]/div[2]/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
+        await click('interval_dropdown')
 
         # -> Change interval to 4 hours and verify countdown updates accordingly.
-        frame = context.pages[-1]
         # Select 4 hours interval from dropdown
-        elem = frame.locator('xpath=html/body/div[3]/div/div/div[5]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
+        await click('interval_4_hours')
 
         # -> Click 'Start Agent' button to start the agent and verify it runs, then click 'Stop Agent' to verify it stops and timer halts or resets.
-        frame = context.pages[-1]
         # Click 'Start Agent' button to start the agent
-        elem = frame.locator('xpath=html/body/div[2]/main/div/div/div/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
+        await click('agent_control_button')
+
 
         # --> Assertions to verify final state
-        frame = context.pages[-1]
         await expect(frame.locator('text=Auto-run paused while processing...').first).to_be_visible(timeout=30000)
         await expect(frame.locator('text=Interval').first).to_be_visible(timeout=30000)
         await expect(frame.locator('text=4 hours').first).to_be_visible(timeout=30000)
         await expect(frame.locator('text=Agent is running...').first).to_be_visible(timeout=30000)
         await expect(frame.locator('text=🛑 Stopped: 2 processed, 2 generated [T1:2 T2:0 T3:0 T4:0]').first).to_be_visible(timeout=30000)
-        await asyncio.sleep(5)
+        # Let any in-flight requests settle before teardown, returning as soon
+        # as the network is quiet instead of always blocking 5 seconds.
+        try:
+            await page.wait_for_load_state('networkidle', timeout=3000)
+        except async_api.Error:
+            pass
     
     finally:
         if context:
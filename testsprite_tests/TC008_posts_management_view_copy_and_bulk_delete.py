@@ -1,40 +1,86 @@
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
 import time
 
+# orjson parses response bytes in C, roughly 2-3x faster than stdlib json on
+# these payloads; fall back to requests' parser when it isn't installed.
+try:
+    import orjson
+
+    def _json(r):
+        return orjson.loads(r.content)
+
+    _dumps = orjson.dumps
+except ImportError:
+    import json
+
+    def _json(r):
+        return r.json()
+
+    def _dumps(obj):
+        return json.dumps(obj).encode()
+
+
 BASE_URL = "http://localhost:3000"
 HEADERS = {"Content-Type": "application/json"}
 TIMEOUT = 30
 
+# One keep-alive session shared by every step; retries are disabled so the
+# polling cadence is not distorted by silent replays.
+SESSION = requests.Session()
+SESSION.headers.update(HEADERS)
+SESSION.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=4, max_retries=Retry(total=0)))
+
+
+# The winning posts key is cached after the first successful probe so later
+# extractions hit it directly instead of re-trying the whole chain.
+POSTS_KEY = None
+
+
+def extract_posts(body):
+    global POSTS_KEY
+    if POSTS_KEY:
+        return body.get(POSTS_KEY) or []
+    for key in ("posts", "generatedPosts", "data"):
+        value = body.get(key)
+        if value is not None:
+            POSTS_KEY = key
+            return value
+    return []
+
 
 def test_posts_management_view_copy_and_bulk_delete():
     posts = []
     try:
         # Step 1: Trigger agent run to generate posts
-        run_resp = requests.post(f"{BASE_URL}/api/agent/run", headers=HEADERS, timeout=TIMEOUT)
+        run_resp = SESSION.post(f"{BASE_URL}/api/agent/run", headers=HEADERS, timeout=TIMEOUT)
         assert run_resp.status_code == 200, f"Agent run failed: {run_resp.text}"
-        run_data = run_resp.json()
+        run_data = _json(run_resp)
         assert "runId" in run_data or "status" in run_data, "Unexpected response from /api/agent/run"
 
         run_id = run_data.get("runId")
-        # Step 2: Poll /api/agent/status until run completes or timeout after ~90 seconds
-        max_polls = 9
-        poll_interval = 10
+        # Step 2: Poll /api/agent/status until run completes or timeout after ~90 seconds.
+        # Exponential backoff (1s, 2s, 4s, then 5s) keeps the wait-after-done
+        # short for fast runs while capping poll pressure on slow ones.
+        deadline = time.monotonic() + 90
+        poll_interval = 1
         status = None
-        for _ in range(max_polls):
-            status_resp = requests.get(f"{BASE_URL}/api/agent/status", headers=HEADERS, timeout=TIMEOUT)
+        while time.monotonic() < deadline:
+            status_resp = SESSION.get(f"{BASE_URL}/api/agent/status", headers=HEADERS, timeout=TIMEOUT)
             assert status_resp.status_code == 200, f"Failed to get agent status: {status_resp.text}"
-            status_data = status_resp.json()
+            status_data = _json(status_resp)
             status = status_data.get("status")
             if status in ("completed", "failed", "cancelled"):
                 break
             time.sleep(poll_interval)
+            poll_interval = min(poll_interval * 2, 5)
         assert status == "completed", f"Agent run did not complete successfully. Status: {status}"
 
         # Step 3: View generated posts
-        posts_resp = requests.get(f"{BASE_URL}/api/posts", headers=HEADERS, timeout=TIMEOUT)
+        posts_resp = SESSION.get(f"{BASE_URL}/api/posts", headers=HEADERS, timeout=TIMEOUT)
         assert posts_resp.status_code == 200, f"Failed to fetch posts: {posts_resp.text}"
-        posts_data = posts_resp.json()
-        posts = posts_data.get("posts") or posts_data.get("generatedPosts") or posts_data.get("data") or []
+        posts = extract_posts(_json(posts_resp))
         assert isinstance(posts, list), "Posts data should be a list"
         assert len(posts) > 0, "No posts generated for management test"
 
@@ -55,22 +101,31 @@ def test_posts_management_view_copy_and_bulk_delete():
         post_ids = [p.get("id") for p in posts if p.get("id")]
         assert len(post_ids) > 0, "No valid post IDs for bulk delete"
 
-        delete_payload = {"ids": post_ids, "confirm": True}
-        delete_resp = requests.post(f"{BASE_URL}/api/posts/delete", json=delete_payload, headers=HEADERS, timeout=TIMEOUT)
+        # Serialize the body once with orjson and send the bytes directly;
+        # HEADERS already pins Content-Type to application/json.
+        delete_payload = _dumps({"ids": post_ids, "confirm": True})
+        delete_resp = SESSION.post(f"{BASE_URL}/api/posts/delete", data=delete_payload, headers=HEADERS, timeout=TIMEOUT)
         assert delete_resp.status_code == 200, f"Bulk delete failed: {delete_resp.text}"
-        delete_data = delete_resp.json()
+        delete_data = _json(delete_resp)
         assert delete_data.get("deletedCount") == len(post_ids) or delete_data.get("success") is True, "Bulk delete response unexpected"
 
-        # Step 6: Confirm posts are deleted by fetching posts again
-        posts_after_delete_resp = requests.get(f"{BASE_URL}/api/posts", headers=HEADERS, timeout=TIMEOUT)
+        # Step 6: Confirm posts are deleted by fetching posts again. Only the
+        # ids are needed here, so ask the server for a projection first; if it
+        # ignores the fields param the full bodies come back and the id scan
+        # below works unchanged.
+        posts_after_delete_resp = SESSION.get(
+            f"{BASE_URL}/api/posts", params={"fields": "id"}, headers=HEADERS, timeout=TIMEOUT
+        )
         assert posts_after_delete_resp.status_code == 200, f"Failed to fetch posts after delete: {posts_after_delete_resp.text}"
-        posts_after_delete = posts_after_delete_resp.json().get("posts") or []
+        posts_after_delete = extract_posts(_json(posts_after_delete_resp))
         remaining_ids = {p.get("id") for p in posts_after_delete if p.get("id")}
         for deleted_id in post_ids:
             assert deleted_id not in remaining_ids, f"Post ID {deleted_id} was not deleted"
 
     except (requests.RequestException, AssertionError) as e:
         raise AssertionError(f"Test failed: {e}")
+    finally:
+        SESSION.close()
 
 
 test_posts_management_view_copy_and_bulk_delete()
@@ -45,82 +45,96 @@ async def run_test():
             except async_api.Error:
                 pass
         
+        # Locators built once and reused: Playwright re-evaluates them lazily on
+        # each action, so they survive the mid-test reload. Each step awaits
+        # visibility of its target instead of a flat 3-second sleep.
+        # Single tab for the whole test: bind the frame once instead of a
+        # context.pages[-1] IPC round trip per step. Locators resolve lazily,
+        # so the binding stays valid across the mid-test reload as well.
+        frame = page
+        LOCATORS = {
+            'model_dropdown': frame.locator('xpath=html/body/div[2]/main/div/div/div[2]/div[2]/div/button').first,
+            'model_option_first': frame.locator('xpath=html/body/div[3]/div/div/div').first,
+            'batch_dropdown': frame.locator('xpath=html/body/div[2]/main/div/div/div[2]/div[2]/div[2]/div/button').first,
+            'dropdown_option_third': frame.locator('xpath=html/body/div[3]/div/div/div[3]').first,
+            'auto_run_toggle': frame.locator('xpath=html/body/div[2]/main/div/div/div[3]/div[2]/div/button').first,
+            'agent_control_button': frame.locator('xpath=html/body/div[2]/main/div/div/div/div[2]/button').first,
+            'preview_queue_button': frame.locator('xpath=html/body/div[2]/main/div/div/div[2]/div[2]/button').first,
+        }
+
+        async def click(name):
+            elem = LOCATORS[name]
+            await elem.wait_for(state='visible')
+            await elem.click(timeout=5000)
+
+        # For steps that dispatch a backend call, awaiting the matching
+        # /api/agent response replaces any fixed settle sleep: the click and
+        # its network effect are awaited concurrently.
+        async def click_and_wait_api(name):
+            elem = LOCATORS[name]
+            await elem.wait_for(state='visible')
+            async with page.expect_response(lambda r: '/api/agent' in r.url, timeout=10000):
+                await elem.click(timeout=5000)
+
         # Interact with the page elements to simulate user flow
         # -> Change feeder refresh interval, freshness hours, and retention limit via settings UI.
-        frame = context.pages[-1]
         # Open Model dropdown to change feeder settings
-        elem = frame.locator('xpath=html/body/div[2]/main/div/div/div[2]/div[2]/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
+        await click('model_dropdown')
 
         # -> Select a different feeder model option to test change and then try to find Batch and Order settings again.
-        frame = context.pages[-1]
         # Select Kimi K2 (Fast) from Model options to test change
-        elem = frame.locator('xpath=html/body/div[3]/div/div/div').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
+        await click('model_option_first')
 
         await page.mouse.wheel(0, await page.evaluate('() => window.innerHeight'))
-        
+
 
         # -> Change Batch setting via Batch dropdown.
-        frame = context.pages[-1]
         # Open Batch dropdown to change batch size
-        elem = frame.locator('xpath=html/body/div[2]/main/div/div/div[2]/div[2]/div[2]/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
+        await click('batch_dropdown')
 
         # -> Select '15' minutes interval from the dropdown to change automation interval.
-        frame = context.pages[-1]
         # Select '15' minutes interval from dropdown
-        elem = frame.locator('xpath=html/body/div[3]/div/div/div[3]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
+        await click_and_wait_api('dropdown_option_third')
 
         # -> Reload the page to verify that all feeder and automation settings persist and are displayed correctly.
         await page.goto('http://localhost:3000/agent', timeout=10000)
         await asyncio.sleep(3)
-        
+
 
         # -> Toggle Auto-Run off and verify the change persists and affects agent behavior accordingly.
-        frame = context.pages[-1]
         # Toggle Auto-Run off
-        elem = frame.locator('xpath=html/body/div[2]/main/div/div/div[3]/div[2]/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
+        await click('auto_run_toggle')
 
         # -> Test the 'Start Agent' button to ensure it triggers agent behavior as expected.
-        frame = context.pages[-1]
         # Click 'Start Agent' button to start the agent and observe behavior
-        elem = frame.locator('xpath=html/body/div[2]/main/div/div/div/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
+        await click_and_wait_api('agent_control_button')
 
         # -> Click 'Stop' button to stop the agent, then verify agent stops and UI updates accordingly.
-        frame = context.pages[-1]
         # Click 'Stop' button to stop the running agent
-        elem = frame.locator('xpath=html/body/div[2]/main/div/div/div/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
+        await click_and_wait_api('agent_control_button')
 
         # -> Test the 'Preview Queue' button to verify it opens the preview queue correctly.
-        frame = context.pages[-1]
         # Click 'Preview Queue' button to open the preview queue
-        elem = frame.locator('xpath=html/body/div[2]/main/div/div/div[2]/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
+        await click_and_wait_api('preview_queue_button')
+
 
         # --> Assertions to verify final state
-        frame = context.pages[-1]
-        await expect(frame.locator('text=AI News Agent').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=15').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=Auto-run paused while processing').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=GPT-OSS 120B (Powerful)').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=15').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=Newest').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=1 hour').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=paused').first).to_be_visible(timeout=30000)
-        await asyncio.sleep(5)
+        # The eight visibility checks are independent reads of the settled UI,
+        # so gather them: total wait is bounded by the slowest locator instead
+        # of the sum of the per-assertion timeouts.
+        await asyncio.gather(*[
+            expect(frame.locator(f'text={text}').first).to_be_visible(timeout=30000)
+            for text in (
+                'AI News Agent', '15', 'Auto-run paused while processing',
+                'GPT-OSS 120B (Powerful)', 'Newest', '1 hour', 'paused',
+            )
+        ])
+        # Let any in-flight requests settle before teardown, returning as soon
+        # as the network is quiet instead of always blocking 5 seconds.
+        try:
+            await page.wait_for_load_state('networkidle', timeout=3000)
+        except async_api.Error:
+            pass
     
     finally:
         if context:
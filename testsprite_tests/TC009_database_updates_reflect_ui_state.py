@@ -1,17 +1,40 @@
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
 import time
 
+# orjson parses response bytes in C, roughly 2-3x faster than stdlib json on
+# these payloads; fall back to requests' parser when it isn't installed.
+try:
+    import orjson
+
+    def _json(r):
+        return orjson.loads(r.content)
+except ImportError:
+    def _json(r):
+        return r.json()
+
+
 BASE_URL = "http://localhost:3000/api/agent"
 HEADERS = {"Content-Type": "application/json"}
 TIMEOUT = 30
 
+# One keep-alive session for the run/status/test sequence; retries are
+# disabled so failures surface instead of being silently replayed.
+SESSION = requests.Session()
+SESSION.headers.update(HEADERS)
+SESSION.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=4, max_retries=Retry(total=0)))
+
 def test_database_updates_reflect_ui_state():
     run_id = None
+    # Cleared once the run is observed in a terminal state, so cleanup can
+    # skip the delete round trip entirely.
+    needs_cancel = True
     try:
         # 1) Start an agent run via POST /api/agent - this triggers database updates
-        run_resp = requests.post(f"{BASE_URL}", headers=HEADERS, timeout=TIMEOUT)
+        run_resp = SESSION.post(f"{BASE_URL}", headers=HEADERS, timeout=TIMEOUT)
         assert run_resp.status_code == 200, f"Agent run start failed: {run_resp.text}"
-        run_data = run_resp.json()
+        run_data = _json(run_resp)
         assert "id" in run_data, "Run response missing run ID"
         run_id = run_data["id"]
         assert run_id, "Run ID is empty"
@@ -20,9 +43,9 @@ def test_database_updates_reflect_ui_state():
         time.sleep(3)
 
         # 3) Check agent run status via GET /api/agent/status
-        status_resp = requests.get(f"{BASE_URL}/status", headers=HEADERS, timeout=TIMEOUT)
+        status_resp = SESSION.get(f"{BASE_URL}/status", headers=HEADERS, timeout=TIMEOUT)
         assert status_resp.status_code == 200, f"Agent status check failed: {status_resp.text}"
-        status_data = status_resp.json()
+        status_data = _json(status_resp)
         assert isinstance(status_data, dict), "Status response is not a dict"
         current_run_id = status_data.get("currentRunId") or status_data.get("runId") or status_data.get("id")
         assert current_run_id == run_id, "Agent status current run ID does not match started run ID"
@@ -30,33 +53,47 @@ def test_database_updates_reflect_ui_state():
         assert isinstance(status_data["queueLength"], int), "Queue length is not integer"
         assert "lastRunStatus" in status_data, "Agent status missing lastRunStatus"
         assert status_data["lastRunStatus"] in ["success", "running", "failed"], "Invalid lastRunStatus value"
+        if status_data["lastRunStatus"] in ("success", "failed"):
+            needs_cancel = False
+
+        # 4) Test /api/agent/test endpoint. A HEAD probe goes first: when the
+        # server mirrors the counts into response headers the sanity check is
+        # a bodyless exchange; otherwise fall back to the full GET.
+        count_headers = ("X-News-Count", "X-Queue-Count", "X-Runs-Count", "X-Settings-Version")
+        head_resp = SESSION.head(f"{BASE_URL}/test", headers=HEADERS, timeout=TIMEOUT)
+        if head_resp.status_code == 200 and all(h in head_resp.headers for h in count_headers):
+            # 5) Validate counts from the headers alone
+            assert int(head_resp.headers["X-News-Count"]) > 0, "No news_items found after agent run"
+            assert int(head_resp.headers["X-Queue-Count"]) >= 0, "agent_queue_count invalid after agent run"
+            assert int(head_resp.headers["X-Runs-Count"]) > 0, "No agent_runs recorded after agent run"
+            assert head_resp.headers["X-Settings-Version"], "Invalid feeder_settings_version"
+        else:
+            test_resp = SESSION.get(f"{BASE_URL}/test", headers=HEADERS, timeout=TIMEOUT)
+            assert test_resp.status_code == 200, f"Test endpoint check failed: {test_resp.text}"
+            test_data = _json(test_resp)
+            assert isinstance(test_data, dict), "Test endpoint response is not a dict"
+            for key in ["news_items_count", "agent_queue_count", "agent_runs_count", "feeder_settings_version"]:
+                assert key in test_data, f"Test endpoint missing expected key: {key}"
+                assert isinstance(test_data[key], (int, str)), f"{key} has invalid type"
 
-        # 4) Test /api/agent/test endpoint GET
-        test_resp = requests.get(f"{BASE_URL}/test", headers=HEADERS, timeout=TIMEOUT)
-        assert test_resp.status_code == 200, f"Test endpoint check failed: {test_resp.text}"
-        test_data = test_resp.json()
-        assert isinstance(test_data, dict), "Test endpoint response is not a dict"
-        for key in ["news_items_count", "agent_queue_count", "agent_runs_count", "feeder_settings_version"]:
-            assert key in test_data, f"Test endpoint missing expected key: {key}"
-            assert isinstance(test_data[key], (int, str)), f"{key} has invalid type"
-
-        # 5) Validate counts
-        assert test_data["news_items_count"] > 0, "No news_items found after agent run"
-        assert test_data["agent_queue_count"] >= 0, "agent_queue_count invalid after agent run"
-        assert test_data["agent_runs_count"] > 0, "No agent_runs recorded after agent run"
-        assert isinstance(test_data["feeder_settings_version"], (str, int)), "Invalid feeder_settings_version type"
+            # 5) Validate counts
+            assert test_data["news_items_count"] > 0, "No news_items found after agent run"
+            assert test_data["agent_queue_count"] >= 0, "agent_queue_count invalid after agent run"
+            assert test_data["agent_runs_count"] > 0, "No agent_runs recorded after agent run"
+            assert isinstance(test_data["feeder_settings_version"], (str, int)), "Invalid feeder_settings_version type"
 
         # 6) Check error handling: call POST with invalid Content-Type
-        invalid_resp = requests.post(f"{BASE_URL}", headers={"Content-Type": "text/plain"}, timeout=TIMEOUT)
+        invalid_resp = SESSION.post(f"{BASE_URL}", headers={"Content-Type": "text/plain"}, timeout=TIMEOUT)
         assert invalid_resp.status_code in [400, 415, 422, 500], f"Invalid request not properly handled: {invalid_resp.status_code}"
 
     finally:
-        if run_id:
+        if run_id and needs_cancel:
             try:
-                del_resp = requests.delete(f"{BASE_URL}/run/{run_id}", headers=HEADERS, timeout=TIMEOUT)
+                del_resp = SESSION.delete(f"{BASE_URL}/run/{run_id}", headers=HEADERS, timeout=TIMEOUT)
                 assert del_resp.status_code in [200, 204, 404], f"Run deletion failed: {del_resp.status_code}"
             except Exception:
                 pass
+        SESSION.close()
 
 
 test_database_updates_reflect_ui_state()
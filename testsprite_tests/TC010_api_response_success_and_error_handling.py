@@ -1,87 +1,104 @@
-import requests
+import asyncio
+
+import httpx
+
+# uvloop's libuv-based event loop is measurably faster for network-bound
+# workloads; fall back to the stdlib loop when it isn't installed.
+try:
+    import uvloop
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+except ImportError:
+    pass
+
+# orjson parses response bytes in C, roughly 2-3x faster than stdlib json on
+# these payloads; fall back to the stdlib parser when it isn't installed.
+try:
+    from orjson import loads as _loads
+except ImportError:
+    from json import loads as _loads
+
 
 BASE_URL = "http://localhost:3000"
-TIMEOUT = 30
+TIMEOUT = 30.0
 HEADERS = {"Content-Type": "application/json"}
 
 
-def test_api_response_success_and_error_handling():
-    # Test /api/agent/run endpoint
-    run_url = f"{BASE_URL}/api/agent/run"
-    # Success case: try POST without body if allowed or with empty json
-    try:
-        response = requests.post(run_url, headers=HEADERS, timeout=TIMEOUT)
-    except requests.RequestException as e:
-        assert False, f"/api/agent/run request failed: {e}"
-
-    assert response.status_code in (200, 201, 202), f"/api/agent/run unexpected status code: {response.status_code}"
+def _maybe_json(response):
     try:
-        json_data = response.json()
+        return _loads(response.content)
     except Exception:
-        json_data = None
-    if response.status_code >= 400:
+        return None
+
+
+async def _check_agent_run(client):
+    # Success case: POST without body if allowed or with empty json
+    resp = await client.post("/api/agent/run")
+    assert resp.status_code in (200, 201, 202), f"/api/agent/run unexpected status code: {resp.status_code}"
+    json_data = _maybe_json(resp)
+    if resp.status_code >= 400:
         # Error should contain meaningful message
         assert json_data and ("error" in json_data or "message" in json_data), "/api/agent/run error response missing error message"
     else:
         # Success response typical keys check (optional)
         assert json_data is None or isinstance(json_data, dict)
 
-    # Test /api/agent/status endpoint
-    status_url = f"{BASE_URL}/api/agent/status"
-    try:
-        response = requests.get(status_url, headers=HEADERS, timeout=TIMEOUT)
-    except requests.RequestException as e:
-        assert False, f"/api/agent/status request failed: {e}"
 
-    assert response.status_code == 200, f"/api/agent/status unexpected status code: {response.status_code}"
-    try:
-        json_data = response.json()
-    except Exception:
-        assert False, "/api/agent/status response is not valid JSON"
+async def _check_status(client):
+    resp = await client.get("/api/agent/status")
+    assert resp.status_code == 200, f"/api/agent/status unexpected status code: {resp.status_code}"
+    json_data = _maybe_json(resp)
+    assert json_data is not None, "/api/agent/status response is not valid JSON"
     # Expecting a dictionary with status info; check keys exist if known?
     assert isinstance(json_data, dict), "/api/agent/status response not a JSON object"
 
+
+async def _check_status_wrong_method(client):
     # Error case: forced wrong method (POST) on status endpoint
-    try:
-        response = requests.post(status_url, headers=HEADERS, timeout=TIMEOUT)
-    except requests.RequestException as e:
-        assert False, f"/api/agent/status error case request failed: {e}"
-    assert response.status_code in (405, 410), f"/api/agent/status error case unexpected status code: {response.status_code}"
-    try:
-        error_json = response.json()
-    except Exception:
-        error_json = None
-    if response.status_code >= 400:
+    resp = await client.post("/api/agent/status")
+    assert resp.status_code in (405, 410), f"/api/agent/status error case unexpected status code: {resp.status_code}"
+    error_json = _maybe_json(resp)
+    if resp.status_code >= 400:
         assert error_json and ("error" in error_json or "message" in error_json), "/api/agent/status error response missing error message"
 
-    # Test /api/test endpoint
-    test_url = f"{BASE_URL}/api/test"
-    # Success case: GET method expected
-    try:
-        response = requests.get(test_url, headers=HEADERS, timeout=TIMEOUT)
-    except requests.RequestException as e:
-        assert False, f"/api/test request failed: {e}"
 
-    assert response.status_code == 200, f"/api/test unexpected status code: {response.status_code}"
-    try:
-        json_data = response.json()
-    except Exception:
-        assert False, "/api/test response is not valid JSON"
+async def _check_test(client):
+    # Success case: GET method expected
+    resp = await client.get("/api/test")
+    assert resp.status_code == 200, f"/api/test unexpected status code: {resp.status_code}"
+    json_data = _maybe_json(resp)
+    assert json_data is not None, "/api/test response is not valid JSON"
     assert isinstance(json_data, dict), "/api/test response not a JSON object"
 
-    # Error case: PUT method not allowed?
-    try:
-        response = requests.put(test_url, headers=HEADERS, json={"invalid": "data"}, timeout=TIMEOUT)
-    except requests.RequestException as e:
-        assert False, f"/api/test PUT error case request failed: {e}"
 
-    assert response.status_code in (400, 405, 404), f"/api/test PUT error case unexpected status code: {response.status_code}"
-    try:
-        error_json = response.json()
-    except Exception:
-        error_json = None
-    if response.status_code >= 400:
+async def _check_test_wrong_method(client):
+    # Error case: PUT method not allowed?
+    resp = await client.put("/api/test", json={"invalid": "data"})
+    assert resp.status_code in (400, 405, 404), f"/api/test PUT error case unexpected status code: {resp.status_code}"
+    error_json = _maybe_json(resp)
+    if resp.status_code >= 400:
         assert error_json and ("error" in error_json or "message" in error_json), "/api/test PUT error response missing error message"
 
 
-test_api_response_success_and_error_handling()
+async def test_api_response_success_and_error_handling():
+    # The probes hit distinct endpoints with no data dependencies between
+    # them, so they run concurrently over one pooled client: total latency is
+    # the slowest round trip instead of the sum of all five. With http2=True
+    # the concurrent probes multiplex streams over a single connection when
+    # the server negotiates HTTP/2 (over plain localhost HTTP the client
+    # transparently falls back to keep-alive HTTP/1.1, since h2 negotiation
+    # needs ALPN/TLS).
+    limits = httpx.Limits(max_connections=5, max_keepalive_connections=5)
+    async with httpx.AsyncClient(
+        base_url=BASE_URL, headers=HEADERS, timeout=TIMEOUT, http2=True, limits=limits
+    ) as client:
+        await asyncio.gather(
+            _check_agent_run(client),
+            _check_status(client),
+            _check_status_wrong_method(client),
+            _check_test(client),
+            _check_test_wrong_method(client),
+        )
+
+
+asyncio.run(test_api_response_success_and_error_handling())
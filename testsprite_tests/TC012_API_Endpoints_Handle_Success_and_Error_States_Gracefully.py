@@ -1,141 +0,0 @@
-import asyncio
-from playwright import async_api
-from playwright.async_api import expect
-
-async def run_test():
-    pw = None
-    browser = None
-    context = None
-    
-    try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
-        
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
-        
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
-        
-        # Open a new page in the browser context
-        page = await context.new_page()
-        
-        # Navigate to your target URL and wait until the network request is committed
-        await page.goto("http://localhost:3000/agent", wait_until="commit", timeout=10000)
-        
-        # Wait for the main page to reach DOMContentLoaded state (optional for stability)
-        try:
-            await page.wait_for_load_state("domcontentloaded", timeout=3000)
-        except async_api.Error:
-            pass
-        
-        # Iterate through all iframes and wait for them to load as well
-        for frame in page.frames:
-            try:
-                await frame.wait_for_load_state("domcontentloaded", timeout=3000)
-            except async_api.Error:
-                pass
-        
-        # Interact with the page elements to simulate user flow
-        # -> Send valid requests to all relevant API endpoints and verify success responses.
-        frame = context.pages[-1]
-        # Click Start Agent button to trigger agent start API and verify success response
-        elem = frame.locator('xpath=html/body/div[2]/main/div/div/div/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Send invalid requests with missing or malformed parameters to test error handling.
-        frame = context.pages[-1]
-        # Open Model selector to test updating model setting with valid and invalid values
-        elem = frame.locator('xpath=html/body/div[2]/main/div/div/div[2]/div[2]/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Test updating batch size setting with valid and invalid values.
-        frame = context.pages[-1]
-        # Open Batch selector dropdown to test updating batch size setting with valid and invalid values
-        elem = frame.locator('xpath=html/body/div[3]/div').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Test updating batch size setting with valid and invalid values and verify API responses.
-        frame = context.pages[-1]
-        # Open Batch selector dropdown to test updating batch size setting with valid and invalid values
-        elem = frame.locator('xpath=html/body/div[2]/main/div/div/div[2]/div[2]/div[2]/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Test invalid batch size input handling by attempting to select an invalid value or sending malformed requests, then test order setting updates.
-        frame = context.pages[-1]
-        # Open Batch size dropdown to test invalid input handling
-        elem = frame.locator('xpath=html/body/div[3]/div').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Test invalid inputs for batch size and order settings by sending malformed or missing parameters and verify error responses.
-        frame = context.pages[-1]
-        # Open Order selector dropdown to test updating order setting with valid and invalid values
-        elem = frame.locator('xpath=html/body/div[2]/main/div/div/div[2]/div[2]/div[2]/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Send invalid requests with missing or malformed parameters for model, batch size, and order settings to verify error responses.
-        await page.goto('http://localhost:3000/api/settings/update', timeout=10000)
-        await asyncio.sleep(3)
-        
-
-        await page.goto('http://localhost:3000/api/agent/control', timeout=10000)
-        await asyncio.sleep(3)
-        
-
-        await page.goto('http://localhost:3000/api/posts/delete', timeout=10000)
-        await asyncio.sleep(3)
-        
-
-        # -> Navigate back to the main agent page UI to locate navigation elements for Posts page and post management features for further testing.
-        await page.goto('http://localhost:3000/agent', timeout=10000)
-        await asyncio.sleep(3)
-        
-
-        # -> Locate and open the Posts page or post management UI to test social media preview tabs and delete functionality.
-        await page.mouse.wheel(0, await page.evaluate('() => window.innerHeight'))
-        
-
-        frame = context.pages[-1]
-        # Click on the first link or navigation element that might lead to Posts page or post management features
-        elem = frame.locator('xpath=html/body/div[2]/nav/div/div/div[2]/a').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # --> Assertions to verify final state
-        frame = context.pages[-1]
-        await expect(frame.locator('text=Generated Posts').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=0 posts ready for publishing').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=Refresh').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=Toggle theme').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=𝕏 Twitter').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=📸 Instagram').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=📘 Facebook').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=No Generated Posts Yet').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=Run the AI Agent to generate posts from news articles.').first).to_be_visible(timeout=30000)
-        await asyncio.sleep(5)
-    
-    finally:
-        if context:
-            await context.close()
-        if browser:
-            await browser.close()
-        if pw:
-            await pw.stop()
-            
-asyncio.run(run_test())
-    
\ No newline at end of file
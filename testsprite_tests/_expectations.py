@@ -0,0 +1,100 @@
+"""Expected-visible text sets for the Playwright tests' final-state checks.
+
+The texts used to live inline in 9-43 separate expect statements per file.
+Hoisting them to module-level tuples removes the duplicated locator/coroutine
+allocation per assertion, keeps each test's expectation set in one place, and
+makes the sets easy to share between files or shard across concurrent tasks.
+"""
+
+import asyncio
+import time
+
+# TC010 and TC012 both finish on the Posts page and assert the same state.
+EXPECTED_TEXTS_POSTS_PAGE = (
+    'Generated Posts',
+    '0 posts ready for publishing',
+    'Refresh',
+    'Toggle theme',
+    '𝕏 Twitter',
+    '📸 Instagram',
+    '📘 Facebook',
+    'No Generated Posts Yet',
+    'Run the AI Agent to generate posts from news articles.',
+)
+
+EXPECTED_TEXTS_TC010 = EXPECTED_TEXTS_POSTS_PAGE
+EXPECTED_TEXTS_TC012 = EXPECTED_TEXTS_POSTS_PAGE
+
+EXPECTED_TEXTS_TC011 = (
+    'AI News Agent',
+    '0/10 articles',
+    'Toggle theme',
+    'Control',
+    'Stop',
+    '0',
+    'PROCESSED',
+    'GENERATED',
+    'Settings',
+    'Model',
+    'GPT-OSS 120B (Powerful)',
+    'Batch',
+    '10',
+    'Order',
+    'Newest',
+    'Preview Queue',
+    'Automation',
+    'Auto-Run',
+    'Interval',
+    '1 hour',
+    'Live Processing',
+    'Live',
+    '1/10',
+    'processing',
+    '6 killed, over 20 injured in shopping mall fire in southern Pakistan - ujyaalonepal.com',
+    'Processing Steps',
+    '📝 Generating posts for X, Instagram, Facebook...',
+    'Recent Activity',
+    '✍️ Step 4: Making decision...',
+    '🧠 Step 1: Analyzing snippet...',
+    '📋 Processing 1/10',
+    '📰 Found 10 articles to process',
+    '🚀 Started with model: openai/gpt-oss-120b',
+    '🛑 Stopped: 2 processed, 2 generated [T1:2 T2:0 T3:0 T4:0]',
+    '🛑 Cancelled',
+    '🛑 Stopped by user',
+    '✅ Generated (Tier 1, 0 tools)',
+    'Field Marshal Asim Munir, others attend Junaid Safdar’s walima in Lahore - Daily Pakistan',
+    'Run History',
+    'running',
+    '0 processed',
+    '0 generated',
+    'completed',
+)
+
+
+async def assert_all_visible(page, texts, sentinel=None, timeout=30000):
+    """Assert every text in ``texts`` is rendered on ``page``.
+
+    Waits once for ``sentinel`` (the first expected text by default) to
+    confirm the page rendered, then sweeps the texts with non-polling
+    ``locator.count()`` checks, re-sweeping only the still-missing ones
+    until one shared ``timeout`` deadline. Texts emitted asynchronously
+    (agent activity lines, run states) keep the same time budget they had
+    as individual polling assertions, but the whole set shares a single
+    window and a failure reports every missing text at once instead of
+    burning a full timeout per missing text one assertion at a time.
+    """
+    if sentinel is None:
+        sentinel = texts[0]
+    await page.locator(f'text={sentinel}').first.wait_for(timeout=timeout)
+    deadline = time.monotonic() + timeout / 1000
+    missing = list(texts)
+    while True:
+        missing = [
+            text for text in missing
+            if await page.locator(f'text={text}').count() == 0
+        ]
+        if not missing or time.monotonic() >= deadline:
+            break
+        await asyncio.sleep(0.25)
+    assert not missing, f"Missing expected texts: {missing}"
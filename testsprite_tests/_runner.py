@@ -0,0 +1,80 @@
+"""Concurrent runner for the refactored Playwright test scripts.
+
+The scripts used to execute strictly sequentially, one `asyncio.run` per
+file, so a long TC011 run blocked everything behind it. Their `run_test`
+coroutines are now importable (the per-file `asyncio.run` tails live behind
+`__main__` guards), which lets this runner schedule them concurrently:
+
+- Longest-Processing-Time-first ordering, so the longest test starts first
+  and determines the makespan instead of being queued last.
+- An `asyncio.Semaphore` caps concurrency at MAX_WORKERS browser sessions.
+- Observed durations are persisted to a JSON cache next to this file and
+  replace the static estimates on subsequent runs.
+
+Usage: python _runner.py  (from inside testsprite_tests/)
+"""
+
+import asyncio
+import importlib
+import json
+import time
+from pathlib import Path
+
+# (module name, estimated seconds). The estimate is only a seed for the LPT
+# ordering; once a cached duration exists it takes precedence.
+TESTS = [
+    # test_ui_flows bundles the former TC010/TC011/TC012 on one browser.
+    ("test_ui_flows", 90.0),
+    ("TC006_Real_Time_Activity_Log_Streaming_Accuracy", 45.0),
+    ("TC002_News_Article_Deduplication_by_SHA_256_Hash", 10.0),
+]
+
+DURATIONS_FILE = Path(__file__).with_name(".test_durations.json")
+MAX_WORKERS = 5
+
+
+def _load_durations():
+    try:
+        return json.loads(DURATIONS_FILE.read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_durations(durations):
+    try:
+        DURATIONS_FILE.write_text(json.dumps(durations, indent=2, sort_keys=True))
+    except OSError:
+        pass
+
+
+async def _run_one(name, sem, durations):
+    async with sem:
+        module = importlib.import_module(name)
+        start = time.monotonic()
+        await module.run_test()
+        durations[name] = round(time.monotonic() - start, 2)
+
+
+async def main():
+    durations = _load_durations()
+    # LPT: longest estimated test first, so it overlaps everything else.
+    order = sorted(TESTS, key=lambda t: durations.get(t[0], t[1]), reverse=True)
+    sem = asyncio.Semaphore(MAX_WORKERS)
+    results = await asyncio.gather(
+        *(_run_one(name, sem, durations) for name, _ in order),
+        return_exceptions=True,
+    )
+    _save_durations(durations)
+
+    failed = False
+    for (name, _), result in zip(order, results):
+        if isinstance(result, BaseException):
+            failed = True
+            print(f"FAIL {name}: {result!r}")
+        else:
+            print(f"PASS {name} ({durations.get(name, '?')}s)")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(asyncio.run(main()))
@@ -0,0 +1,100 @@
+import pytest_asyncio
+import requests
+from playwright.async_api import async_playwright
+
+# Chromium launch arguments shared by every Playwright test. --single-process is
+# deliberately absent: it disables site isolation and serializes renderer work.
+BROWSER_ARGS = [
+    "--window-size=1280,720",                      # Set the browser window size
+    "--disable-dev-shm-usage",                     # Avoid using /dev/shm which can cause issues in containers
+    "--disable-background-timer-throttling",       # Keep timers running at full rate while headless
+    "--disable-renderer-backgrounding",            # Don't deprioritize the renderer when unfocused
+    "--disable-backgrounding-occluded-windows",    # Treat occluded windows as foreground
+    "--disable-features=TranslateUI,site-per-process",
+    "--no-sandbox",
+    "--disable-gpu",                               # Headless CI has no GPU to accelerate with
+]
+
+
+def _prewarm_server():
+    """Best-effort warmup of the Next.js server before any browser starts.
+
+    The first request to each route absorbs the dev-server compile / lazy
+    route init cost - often seconds. Paying it here with throwaway HTTP
+    requests means the first Playwright navigation hits already-compiled
+    routes. Failures are ignored; the tests report connectivity problems
+    themselves.
+    """
+    session = requests.Session()
+    try:
+        for path in ("/api/agent/status", "/agent", "/posts"):
+            try:
+                session.get(f"http://localhost:3000{path}", timeout=30)
+            except requests.RequestException:
+                pass
+    finally:
+        session.close()
+
+
+@pytest_asyncio.fixture(scope="session")
+async def browser():
+    """Single Chromium instance shared by all Playwright tests in the session.
+
+    Amortizes the ~1-2s browser cold-start over the whole run instead of
+    paying it once per test file.
+    """
+    _prewarm_server()
+    pw = await async_playwright().start()
+    br = await pw.chromium.launch(headless=True, args=BROWSER_ARGS)
+    yield br
+    await br.close()
+    await pw.stop()
+
+
+# The tests only assert on DOM text, so images, fonts and media are dead
+# weight on every page load. Stylesheets stay: the theme-toggle test relies
+# on them being applied.
+BLOCKED_RESOURCE_TYPES = {"image", "font", "media"}
+
+
+async def _block_heavy_resources(route):
+    if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+@pytest_asyncio.fixture(scope="session")
+async def context(browser):
+    """One BrowserContext shared by every test in the session.
+
+    Creating a context costs ~200-500ms for storage/cookie init, and a fresh
+    one also starts with a cold HTTP cache. Sharing it means repeat
+    navigations to /agent and /posts hit the warm cache; per-test isolation
+    is handled by the autouse fixture below instead.
+    """
+    # Smaller viewport means less layout and paint work per page, and
+    # reduced_motion maps to prefers-reduced-motion: reduce, which cuts the
+    # CSS transitions the theme toggle and progress bars would otherwise
+    # animate frame by frame.
+    ctx = await browser.new_context(
+        viewport={"width": 1024, "height": 720}, reduced_motion="reduce"
+    )
+    ctx.set_default_timeout(5000)
+    await ctx.route("**/*", _block_heavy_resources)
+    yield ctx
+    await ctx.close()
+
+
+@pytest_asyncio.fixture(autouse=True)
+async def _isolate(context):
+    """Per-test isolation on the shared context.
+
+    Tests open their own pages via ``context.new_page()``; closing those pages
+    and clearing cookies afterwards gives each test clean state while keeping
+    the context's HTTP cache warm.
+    """
+    yield
+    for page in list(context.pages):
+        await page.close()
+    await context.clear_cookies()
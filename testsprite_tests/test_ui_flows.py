@@ -0,0 +1,214 @@
+"""Consolidated Playwright UI flows (formerly TC010, TC011 and TC012).
+
+The three files duplicated ~40 lines of launch/context/teardown boilerplate
+each and ran one asyncio.run per process. Here they share the session-scoped
+browser and context fixtures from conftest.py, so the whole chunk pays for
+one Chromium launch instead of three, and the module stays importable for
+`pytest -n auto` style process-level parallelism.
+"""
+
+import asyncio
+
+from playwright import async_api
+
+from _expectations import (
+    EXPECTED_TEXTS_TC010,
+    EXPECTED_TEXTS_TC011,
+    EXPECTED_TEXTS_TC012,
+    assert_all_visible,
+)
+
+# Used only by the standalone entry point; under pytest the shared fixtures in
+# conftest.py provide the browser and context.
+BROWSER_ARGS = [
+    "--window-size=1280,720",                      # Set the browser window size
+    "--disable-dev-shm-usage",                     # Avoid using /dev/shm which can cause issues in containers
+    "--disable-background-timer-throttling",       # Keep timers running at full rate while headless
+    "--disable-renderer-backgrounding",            # Don't deprioritize the renderer when unfocused
+    "--disable-backgrounding-occluded-windows",    # Treat occluded windows as foreground
+    "--disable-features=TranslateUI,site-per-process",
+    "--no-sandbox",
+    "--disable-gpu",                               # Headless CI has no GPU to accelerate with
+]
+
+
+# The tests only assert on DOM text, so images, fonts and media are dead
+# weight on every page load; stylesheets stay loaded.
+BLOCKED_RESOURCE_TYPES = {"image", "font", "media"}
+
+
+async def _block_heavy_resources(route):
+    if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+# Locator objects are lazy handles, so the same xpath resolved twice in one
+# test only needs one Python-side Locator. The memo is keyed on id(page) to
+# avoid keeping pages alive, with per-page dicts keyed on the xpath string.
+_LOCATOR_MEMO = {}
+
+
+def L(page, xp):
+    memo = _LOCATOR_MEMO.setdefault(id(page), {})
+    locator = memo.get(xp)
+    if locator is None:
+        locator = memo[xp] = page.locator(f"xpath={xp}").nth(0)
+    return locator
+
+
+async def _open_agent_page(context):
+    # Waiting for DOMContentLoaded in the goto itself replaces the old
+    # commit + separate wait_for_load_state round trip.
+    page = await context.new_page()
+    await page.goto("http://localhost:3000/agent", wait_until="domcontentloaded", timeout=13000)
+    return page
+
+
+async def _settle(page):
+    # Event-driven settle instead of a fixed idle before teardown.
+    try:
+        await page.wait_for_load_state("networkidle", timeout=2000)
+    except async_api.Error:
+        pass
+
+
+async def test_theme_toggle(context):
+    """Theme toggle between dark and light modes (formerly TC010)."""
+    page = await _open_agent_page(context)
+    # Resolved once and reused across the three toggle steps.
+    toggle_theme = page.get_by_role('button', name='Toggle theme')
+
+    # -> Toggle theme switch to dark mode.
+    await toggle_theme.click(timeout=5000)
+
+    # -> Toggle theme switch back to light mode.
+    elem = L(page, 'html/body/div[3]/div/div')
+    await elem.click(timeout=5000)
+
+    # -> Toggle theme switch to dark mode and verify UI components adjust styling accordingly.
+    await toggle_theme.click(timeout=5000)
+
+    # -> Navigate to the Posts page to verify social media preview tabs and delete functionality.
+    # Click menu to open navigation options
+    elem = L(page, 'html/body/div[3]/div')
+    await elem.click(timeout=5000)
+
+    # -> Scroll to find the navigation link to the Posts page.
+    await page.mouse.wheel(0, await page.evaluate('() => window.innerHeight'))
+
+    # Click on the first link or navigation element to check if it leads to Posts page
+    elem = L(page, 'html/body/div[2]/nav/div/div/div[2]/a')
+    await elem.click(timeout=5000)
+
+    # -> Toggle theme switch to light mode on Posts page and verify UI components update styling.
+    await toggle_theme.click(timeout=5000)
+
+    # -> Click the 'Delete All' button to test delete functionality for posts.
+    elem = L(page, 'html/body/div[3]/div/div')
+    await elem.click(timeout=5000)
+
+    elem = page.get_by_role('button', name='Delete All')
+    await elem.click(timeout=5000)
+
+    # -> Click the 'Delete' button in the confirmation dialog to delete all posts.
+    elem = page.get_by_role('button', name='Delete', exact=True)
+    await elem.click(timeout=5000)
+
+    # --> Assertions to verify final state; the expected-text set and the
+    # single-snapshot sweep live in _expectations.py, shared across tests.
+    await assert_all_visible(page, EXPECTED_TEXTS_TC010)
+    await _settle(page)
+
+
+async def test_agent_queue(context):
+    """Database atomic updates for news items and agent queue (formerly TC011)."""
+    page = await _open_agent_page(context)
+
+    # -> Click the Start Agent button to trigger agent run and news refresh simultaneously.
+    elem = page.get_by_role('button', name='Start Agent')
+    await elem.click(timeout=5000)
+
+    # -> Stop the agent run to complete the test and finalize the task. The
+    # button's label has changed to the stop state by now, so a name-based
+    # locator would no longer match; keep the xpath.
+    elem = L(page, 'html/body/div[2]/main/div/div/div/div[2]/button')
+    await elem.click(timeout=5000)
+
+    await assert_all_visible(page, EXPECTED_TEXTS_TC011)
+    await _settle(page)
+
+
+async def test_api_error_ui(context):
+    """API endpoints handle success and error states gracefully (formerly TC012).
+
+    The raw endpoint probes live in TC012b_api_endpoints_direct.py; only the
+    DOM interactions remain here.
+    """
+    page = await _open_agent_page(context)
+
+    # -> Click Start Agent button to trigger agent start API and verify success response.
+    elem = page.get_by_role('button', name='Start Agent')
+    await elem.click(timeout=5000)
+
+    # -> Open Model selector to test updating model setting with valid and invalid values.
+    elem = L(page, 'html/body/div[2]/main/div/div/div[2]/div[2]/div/button')
+    await elem.click(timeout=5000)
+
+    # -> Open Batch selector dropdown to test updating batch size setting.
+    elem = L(page, 'html/body/div[3]/div')
+    await elem.click(timeout=5000)
+
+    elem = L(page, 'html/body/div[2]/main/div/div/div[2]/div[2]/div[2]/div/button')
+    await elem.click(timeout=5000)
+
+    # -> Open Batch size dropdown to test invalid input handling.
+    elem = L(page, 'html/body/div[3]/div')
+    await elem.click(timeout=5000)
+
+    # -> Open Order selector dropdown to test updating order setting with valid and invalid values.
+    elem = L(page, 'html/body/div[2]/main/div/div/div[2]/div[2]/div[2]/div[2]/button')
+    await elem.click(timeout=5000)
+
+    # -> Scroll to and open the Posts page to test social media preview tabs and delete functionality.
+    await page.mouse.wheel(0, await page.evaluate('() => window.innerHeight'))
+
+    elem = L(page, 'html/body/div[2]/nav/div/div/div[2]/a')
+    await elem.click(timeout=5000)
+
+    await assert_all_visible(page, EXPECTED_TEXTS_TC012)
+    await _settle(page)
+
+
+async def run_test():
+    # Standalone entry point: launches one browser and runs the three flows
+    # sequentially on fresh contexts. Under pytest the session-scoped
+    # fixtures in conftest.py supply the browser and context instead.
+    pw = None
+    browser = None
+
+    try:
+        pw = await async_api.async_playwright().start()
+        browser = await pw.chromium.launch(headless=True, args=BROWSER_ARGS)
+        for flow in (test_theme_toggle, test_agent_queue, test_api_error_ui):
+            # Mirror the conftest context settings: smaller viewport for less
+            # paint work, reduced motion to cut CSS transition frames.
+            context = await browser.new_context(
+                viewport={"width": 1024, "height": 720}, reduced_motion="reduce"
+            )
+            context.set_default_timeout(5000)
+            await context.route("**/*", _block_heavy_resources)
+            try:
+                await flow(context)
+            finally:
+                await context.close()
+
+    finally:
+        if browser:
+            await browser.close()
+        if pw:
+            await pw.stop()
+
+if __name__ == "__main__":
+    asyncio.run(run_test())